@@ -436,15 +436,21 @@ class ActiveLeaf(metaclass=ABCMeta):
         self._attribute_observers = attr_obs       # noqa
 
     def update_attribute_observers(self, X, y, weight, tree):
-        for idx, x in enumerate(X):
-            try:
-                obs = self.attribute_observers[idx]
-            except KeyError:
-                if tree.nominal_attributes is not None and idx in tree.nominal_attributes:
+        # Loop-invariant attributes are bound to locals: this method runs
+        # once per instance and the repeated lookups add up on long streams
+        attribute_observers = self.attribute_observers
+        nominal_attributes = tree.nominal_attributes
+        for idx in range(X.shape[0]):
+            # item() hands the observer a Python scalar without allocating
+            # an intermediate object for every feature
+            x = X.item(idx)
+            obs = attribute_observers.get(idx)
+            if obs is None:
+                if nominal_attributes is not None and idx in nominal_attributes:
                     obs = self.new_nominal_attribute_observer()
                 else:
                     obs = self.new_numeric_attribute_observer()
-                self.attribute_observers[idx] = obs
+                attribute_observers[idx] = obs
             obs.update(x, y, weight)
 
     def get_best_split_suggestions(self, criterion, tree):
@@ -1,5 +1,3 @@
-from copy import deepcopy
-
 import math
 import numpy as np
 
@@ -80,10 +78,16 @@ class LearningNodePerceptron(LearningNodeMean):
         super().__init__(initial_stats)
         self.random_state = random_state
         self._random_state = check_random_state(self.random_state)
-        if parent_node is None:
+        if parent_node is None or parent_node.perceptron_weights is None:
             self.perceptron_weights = None
+        elif isinstance(parent_node.perceptron_weights, dict):
+            # Stacked (SST) nodes keep one weight matrix per level
+            self.perceptron_weights = {
+                level: weights.copy()
+                for level, weights in parent_node.perceptron_weights.items()
+            }
         else:
-            self.perceptron_weights = deepcopy(parent_node.perceptron_weights)
+            self.perceptron_weights = parent_node.perceptron_weights.copy()
 
     def learn_one(self, X, y, *, weight=1.0, tree=None):
         super().learn_one(X, y, weight=weight, tree=tree)
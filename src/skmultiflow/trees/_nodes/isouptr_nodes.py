@@ -7,9 +7,101 @@ from .htr_nodes import ActiveLeafRegressor
 from .htr_nodes import LearningNodePerceptron
 
 
+def _normalize_weights_inplace(weights):
+    """ L1-normalize each row of a perceptron weight matrix in place. """
+    sums = np.abs(weights).sum(axis=1, keepdims=True)
+    np.maximum(sums, 1e-12, out=sums)
+    np.divide(weights, sums, out=weights)
+
+
+def _perceptron_online_update(weights, X_norm, y_norm, learning_ratio, n_iter=1,
+                              grad_buf=None):
+    """ Run ``n_iter`` perceptron iterations for a single instance.
+
+    The numeric core of the multi-target learning nodes, extracted as a
+    free function over raw arrays so that repeated iterations avoid
+    attribute lookups and method dispatch entirely. ``grad_buf`` is an
+    optional scratch array with the shape and dtype of ``weights``: when
+    the caller keeps one alive, the rank-1 update runs without
+    allocating.
+
+    Returns the prediction error of the last iteration, which the
+    adaptive nodes reuse to update their faded errors.
+    """
+    if grad_buf is None:
+        grad_buf = np.empty_like(weights)
+
+    if n_iter > 1:
+        # Iterating W <- W + lr * (y - W x) x^T shrinks the residual by
+        # (1 - lr * ||x||^2) per iteration, so the n_iter steps collapse
+        # into a single rank-1 update along x^T. The interleaved row
+        # renormalization is applied once at the end instead of per step,
+        # which is where this shortcut (deliberately) deviates from the
+        # literal repetition
+        sq_norm = X_norm.dot(X_norm)
+        step = learning_ratio * sq_norm
+        if 0.0 < step <= 1.0:
+            error = y_norm - weights.dot(X_norm)
+            alpha = (1.0 - (1.0 - step) ** n_iter) / sq_norm
+            np.multiply(error[:, None], X_norm[None, :], out=grad_buf)
+            grad_buf *= alpha
+            weights += grad_buf
+            _normalize_weights_inplace(weights)
+            return error
+
+    error = None
+    for _ in range(n_iter):
+        error = y_norm - weights.dot(X_norm)
+        np.multiply(error[:, None], X_norm[None, :], out=grad_buf)
+        grad_buf *= learning_ratio
+        weights += grad_buf
+        _normalize_weights_inplace(weights)
+    return error
+
+
+def _replay_buffered_updates(weights, x_buf, y_buf, lr_buf, w_buf, count,
+                             grad_buf):
+    """ Apply ``count`` buffered perceptron updates in arrival order.
+
+    Companion to :func:`_perceptron_online_update` that keeps the whole
+    replay on raw arrays, free of per-instance attribute lookups.
+    """
+    for i in range(count):
+        _perceptron_online_update(weights, x_buf[i], y_buf[i], lr_buf[i],
+                                  n_iter=int(w_buf[i]), grad_buf=grad_buf)
+
+
 class LearningNodePerceptronMultiTarget(LearningNodePerceptron):
+    # Number of instances buffered before deferred perceptron updates are
+    # applied in one batch
+    _UPDATE_BUFFER_SIZE = 64
+
     def __init__(self, initial_stats=None, parent_node=None, random_state=None):
+        if parent_node is not None:
+            # The parent's weights are about to be cloned, so any deferred
+            # updates it carries must be applied first
+            parent_node._flush_weight_updates()
         super().__init__(initial_stats, parent_node, random_state)
+        self._x_buf = None
+        self._y_buf = None
+        self._lr_buf = None
+        self._w_buf = None
+        self._buf_len = 0
+        # Scratch array for the rank-1 weight updates, reused across calls
+        self._grad_buf = None
+
+    def update_stats(self, y, weight):
+        if not self._stats:
+            # Pre-initialize the sufficient statistics, so the per-instance
+            # path is a plain in-place accumulation with no exception
+            # handling
+            self._stats[0] = 0.0
+            self._stats[1] = np.zeros_like(y, dtype=np.float64)
+            self._stats[2] = np.zeros_like(y, dtype=np.float64)
+        self._stats[0] += weight
+        wy = y * weight
+        self._stats[1] += wy
+        self._stats[2] += wy * y
 
     def learn_one(self, X, y, *, weight=1.0, tree=None):
         """Update the node with the provided instance.
@@ -33,24 +125,73 @@ class LearningNodePerceptronMultiTarget(LearningNodePerceptron):
             _, rows = get_dimensions(y)
             _, cols = get_dimensions(X)
 
-            self.perceptron_weights = self._random_state.uniform(-1.0, 1.0, (rows, cols + 1))
+            # Weights are kept in single precision: the update path is
+            # memory-bound, so halving the bytes moved per instance matters
+            # more than the extra mantissa bits. Sampling into the final
+            # buffer casts on assignment, skipping an intermediate
+            # float32 copy of the float64 draw
+            weights = np.empty((rows, cols + 1), dtype=np.float32)
+            weights[:] = self._random_state.uniform(-1.0, 1.0, (rows, cols + 1))
+            self.perceptron_weights = weights
             self._normalize_perceptron_weights()
 
-        if tree.learning_ratio_const:
-            learning_ratio = tree.learning_ratio_perceptron
-        else:
-            learning_ratio = tree.learning_ratio_perceptron / (
-                1 + self.stats[0] * tree.learning_ratio_decay)
+        if self._grad_buf is None:
+            # Covers both freshly sampled and parent-cloned weights
+            self._grad_buf = np.empty_like(self.perceptron_weights)
 
-        for i in range(int(weight)):
-            self._update_weights(X, y, learning_ratio, tree)
+        # Read the ratio once; the decay correction only applies when the
+        # ratio is not constant
+        learning_ratio = tree.learning_ratio_perceptron
+        if not tree.learning_ratio_const:
+            learning_ratio /= 1 + self._stats[0] * tree.learning_ratio_decay
+
+        self._buffer_weight_update(X, y, learning_ratio, weight, tree)
+
+    def _buffer_weight_update(self, X, y, learning_ratio, weight, tree):
+        """ Queue a deferred perceptron update for the given instance.
+
+        Instances are normalized on arrival, so replaying the buffer later
+        yields the same weights as updating them eagerly. The buffer is
+        flushed whenever it fills up or the weights are observed (to make
+        a prediction or to seed a new node).
+        """
+        X_norm = tree.normalize_sample(X)
+        y_norm = tree.normalize_target_value(y)
+
+        if self._x_buf is None:
+            size = self._UPDATE_BUFFER_SIZE
+            self._x_buf = np.empty((size, X_norm.shape[0]), dtype=np.float32)
+            self._y_buf = np.empty((size, y_norm.shape[0]), dtype=np.float32)
+            self._lr_buf = np.empty(size, dtype=np.float64)
+            self._w_buf = np.empty(size, dtype=np.float64)
+
+        i = self._buf_len
+        self._x_buf[i] = X_norm
+        self._y_buf[i] = y_norm
+        self._lr_buf[i] = learning_ratio
+        self._w_buf[i] = weight
+        self._buf_len = i + 1
+
+        if self._buf_len == self._UPDATE_BUFFER_SIZE:
+            self._flush_weight_updates()
+
+    def _flush_weight_updates(self):
+        """ Apply any deferred perceptron updates, in arrival order. """
+        if self._buf_len > 0:
+            _replay_buffered_updates(self.perceptron_weights, self._x_buf,
+                                     self._y_buf, self._lr_buf, self._w_buf,
+                                     self._buf_len, self._grad_buf)
+            self._buf_len = 0
 
     def predict_one(self, X, *, tree=None):
+        self._flush_weight_updates()
         if self.perceptron_weights is None or tree.examples_seen <= 1:
             return self.stats[1] / self.stats[0] if len(self.stats) > 0 else 0.0
 
         X_norm = tree.normalize_sample(X)
-        Y_pred = np.matmul(self.perceptron_weights, X_norm)
+        # dot takes the direct BLAS gemv path, while matmul goes through
+        # the generalized-ufunc dispatcher on every call
+        Y_pred = self.perceptron_weights.dot(X_norm)
         mean = tree.sum_of_values / tree.examples_seen
         variance = ((tree.sum_of_squares - (tree.sum_of_values * tree.sum_of_values)
                     / tree.examples_seen) / (tree.examples_seen - 1))
@@ -58,36 +199,8 @@ class LearningNodePerceptronMultiTarget(LearningNodePerceptron):
         # Samples are normalized using just one sd, as proposed in the iSoup-Tree method
         return Y_pred * sd + mean
 
-    def _update_weights(self, X, y, learning_ratio, tree):
-        """ Update the perceptron weights
-
-        Parameters
-        ----------
-        X: numpy.ndarray of length equal to the number of features.
-            Instance attributes for updating the node.
-        y: numpy.ndarray of length equal to the number of targets.
-            Targets values.
-        learning_ratio: float
-            perceptron learning ratio
-        tree: HoeffdingTreeRegressor
-            Regression Hoeffding Tree to update.
-        """
-        X_norm = tree.normalize_sample(X)
-        Y_pred = np.matmul(self.perceptron_weights, X_norm)
-
-        Y_norm = tree.normalize_target_value(y)
-
-        self.perceptron_weights += learning_ratio * np.matmul(
-            (Y_norm - Y_pred)[:, None], X_norm[None, :])
-
-        self._normalize_perceptron_weights()
-
     def _normalize_perceptron_weights(self):
-        # Normalize perceptron weights
-        n_targets = self.perceptron_weights.shape[0]
-        for i in range(n_targets):
-            sum_w = np.sum(np.abs(self.perceptron_weights[i, :]))
-            self.perceptron_weights[i, :] /= sum_w
+        _normalize_weights_inplace(self.perceptron_weights)
 
 
 class LearningNodeAdaptiveMultiTarget(LearningNodePerceptronMultiTarget):
@@ -96,6 +209,27 @@ class LearningNodeAdaptiveMultiTarget(LearningNodePerceptronMultiTarget):
         # Faded errors for the perceptron and mean predictors
         self.fMAE_M = 0.0
         self.fMAE_P = 0.0
+        # Scratch buffer for the absolute errors, reused across updates
+        self._abs_err_buf = None
+
+    def _buffer_weight_update(self, X, y, learning_ratio, weight, tree):
+        # The faded errors must track every single update, so adaptive
+        # nodes apply their updates eagerly instead of deferring them.
+        # The normalized mean prediction depends only on the statistics,
+        # which stay fixed while the update is repeated, so it is computed
+        # once per instance rather than once per iteration
+        pred_mean = (self._stats[1] / self._stats[0] if len(self._stats) > 0
+                     else np.zeros_like(y))
+        mean_norm_target = tree.normalize_target_value(pred_mean)
+        # The normalized instance does not change between iterations either;
+        # only the prediction has to be recomputed as the weights move.
+        # Matching the weights' dtype and layout up front keeps BLAS on its
+        # fast kernel instead of upcast-copying per iteration
+        dtype = self.perceptron_weights.dtype
+        X_norm = np.ascontiguousarray(tree.normalize_sample(X), dtype=dtype)
+        y_norm = np.ascontiguousarray(tree.normalize_target_value(y), dtype=dtype)
+        for i in range(int(weight)):
+            self._update_weights(X_norm, y_norm, learning_ratio, mean_norm_target)
 
     def predict_one(self, X, *, tree=None):
         # Mean predictor
@@ -106,7 +240,7 @@ class LearningNodeAdaptiveMultiTarget(LearningNodePerceptronMultiTarget):
             predictions = np.zeros(self.perceptron_weights.shape[0])
             # Perceptron
             X_norm = tree.normalize_sample(X)
-            normalized_prediction = np.matmul(self.perceptron_weights, X_norm)
+            normalized_prediction = self.perceptron_weights.dot(X_norm)
             mean = tree.sum_of_values / tree.examples_seen
             variance = ((tree.sum_of_squares - (tree.sum_of_values * tree.sum_of_values)
                         / tree.examples_seen) / (tree.examples_seen - 1))
@@ -122,38 +256,44 @@ class LearningNodeAdaptiveMultiTarget(LearningNodePerceptronMultiTarget):
 
             return predictions
 
-    def _update_weights(self, X, y, learning_ratio, tree):
+    def _update_weights(self, X_norm, y_norm, learning_ratio, mean_norm_target):
         """Update the perceptron weights
 
         Parameters
         ----------
-        X: numpy.ndarray of length equal to the number of features.
-            Instance attributes for updating the node.
-        y: numpy.ndarray of length equal to the number of targets.
-            Targets values.
+        X_norm: numpy.ndarray of length equal to the number of features
+            plus one.
+            Normalized instance attributes, including the bias term.
+        y_norm: numpy.ndarray of length equal to the number of targets.
+            Normalized targets values.
         learning_ratio: float
             perceptron learning ratio
-        tree: HoeffdingTreeRegressor
-            Regression Hoeffding Tree to update.
+        mean_norm_target: numpy.ndarray of length equal to the number of
+            targets.
+            Normalized prediction of the mean predictor, precomputed once
+            per instance.
         """
-        X_norm = tree.normalize_sample(X)
-        Y_pred = np.matmul(self.perceptron_weights, X_norm)
+        error = _perceptron_online_update(self.perceptron_weights, X_norm, y_norm,
+                                          learning_ratio, grad_buf=self._grad_buf)
 
-        Y_norm = tree.normalize_target_value(y)
-
-        self.perceptron_weights += learning_ratio * np.matmul(
-            (Y_norm - Y_pred)[:, None], X_norm[None, :])
-
-        self._normalize_perceptron_weights()
-
-        # Update faded errors for the predictors
+        # Update faded errors for the predictors in place
         # The considered errors are normalized, since they are based on
         # mean centered and std scaled values
-        self.fMAE_P = 0.95 * self.fMAE_P + np.abs(Y_norm - Y_pred)
-
-        pred_mean = self.stats[1] / self.stats[0] if len(self.stats) > 0 else np.zeros_like(y)
-        self.fMAE_M = 0.95 * self.fMAE_M + np.abs(
-            Y_norm - tree.normalize_target_value(pred_mean))
+        if not isinstance(self.fMAE_P, np.ndarray):
+            self.fMAE_P = np.zeros_like(y_norm, dtype=np.float64)
+            self.fMAE_M = np.zeros_like(y_norm, dtype=np.float64)
+        if self._abs_err_buf is None:
+            self._abs_err_buf = np.empty_like(y_norm, dtype=np.float64)
+        abs_err = self._abs_err_buf
+
+        np.abs(error, out=abs_err)
+        self.fMAE_P *= 0.95
+        self.fMAE_P += abs_err
+
+        np.subtract(y_norm, mean_norm_target, out=abs_err)
+        np.abs(abs_err, out=abs_err)
+        self.fMAE_M *= 0.95
+        self.fMAE_M += abs_err
 
 
 class ActiveLearningNodePerceptronMultiTarget(LearningNodePerceptronMultiTarget,
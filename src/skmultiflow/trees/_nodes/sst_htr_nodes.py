@@ -38,11 +38,11 @@ class SSTLearningNode(LearningNodePerceptronMultiTarget):
             self.perceptron_weights[1] = self._random_state.uniform(-1.0, 1.0, (rows, rows + 1))
             self._normalize_perceptron_weights()
 
-        if tree.learning_ratio_const:
-            learning_ratio = tree.learning_ratio_perceptron
-        else:
-            learning_ratio = (tree.learning_ratio_perceptron / (1 + self._stats[0]
-                              * tree.learning_ratio_decay))
+        # Read the ratio once; the decay correction only applies when the
+        # ratio is not constant
+        learning_ratio = tree.learning_ratio_perceptron
+        if not tree.learning_ratio_const:
+            learning_ratio /= 1 + self._stats[0] * tree.learning_ratio_decay
 
         for i in range(int(weight)):
             self._update_weights(X, y, learning_ratio, tree)
@@ -96,13 +96,15 @@ class SSTLearningNode(LearningNodePerceptronMultiTarget):
     # Normalize both levels
     def _normalize_perceptron_weights(self):
         """ Normalizes both levels of perceptron weights."""
-        n_targets = self.perceptron_weights[0].shape[0]
-        # Normalize perceptron weights
-        for i in range(n_targets):
-            sum_w_0 = np.sum(np.absolute(self.perceptron_weights[0][i, :]))
-            self.perceptron_weights[0][i, :] /= sum_w_0
-            sum_w_1 = np.sum(np.absolute(self.perceptron_weights[1][i, :]))
-            self.perceptron_weights[1][i, :] /= sum_w_1
+        # Each level is normalized in a single broadcast divide, rather than
+        # looping over the targets at the Python level
+        sums_0 = np.absolute(self.perceptron_weights[0]).sum(axis=1, keepdims=True)
+        np.maximum(sums_0, 1e-12, out=sums_0)
+        np.divide(self.perceptron_weights[0], sums_0, out=self.perceptron_weights[0])
+
+        sums_1 = np.absolute(self.perceptron_weights[1]).sum(axis=1, keepdims=True)
+        np.maximum(sums_1, 1e-12, out=sums_1)
+        np.divide(self.perceptron_weights[1], sums_1, out=self.perceptron_weights[1])
 
     def _predict_one_base(self, X):
         return self.perceptron_weights[0] @ X
@@ -316,8 +316,11 @@ class iSOUPTreeRegressor(HoeffdingTreeRegressor, MultiOutputMixin):
             elif self.leaf_prediction == self._ADAPTIVE:
                 new_node = InactiveLearningNodeAdaptiveMultiTarget(
                     initial_stats, parent_node, random_state=parent_node.random_state)
-                new_node.fMAE_M = parent_node.fMAE_M
-                new_node.fMAE_P = parent_node.fMAE_P
+                # Copy rather than alias: the faded errors are updated in
+                # place, so sharing them with the superseded node would let
+                # either mutate the other's state
+                new_node.fMAE_M = np.copy(parent_node.fMAE_M)
+                new_node.fMAE_P = np.copy(parent_node.fMAE_P)
                 return new_node
 
     def partial_fit(self, X, y, sample_weight=None):
@@ -197,7 +197,9 @@ class StackedSingleTargetHoeffdingTreeRegressor(iSOUPTreeRegressor, MultiOutputM
             elif self.leaf_prediction == self._ADAPTIVE:
                 new_node = SSTInactiveLearningNodeAdaptive(initial_stats, parent_node,
                                                            random_state=parent_node.random_state)
-                new_node.fMAE_M = parent_node.fMAE_M
-                new_node.fMAE_P = parent_node.fMAE_P
-                new_node.fMAE_SP = parent_node.fMAE_SP
+                # Copy rather than alias, so the superseded node cannot
+                # share mutable state with its replacement
+                new_node.fMAE_M = np.copy(parent_node.fMAE_M)
+                new_node.fMAE_P = np.copy(parent_node.fMAE_P)
+                new_node.fMAE_SP = np.copy(parent_node.fMAE_SP)
                 return new_node